@@ -38,6 +38,7 @@ def archive(ar_file, outdir, fscrunch, window, label, dedisperse, gfr, free_alph
     rmnest.fit(gfr=gfr, free_alpha=free_alpha, label=label, outdir=outdir)
     rmnest.print_summary()
     rmnest.plot_corner()
+    rmnest.plot_posterior_predictive()
 
     print("Done!")
 
@@ -58,6 +59,7 @@ def txtfile(stokes_file, outdir, label, gfr, free_alpha):
     rmnest.fit(gfr=gfr, free_alpha=free_alpha, label=label, outdir=outdir)
     rmnest.print_summary()
     rmnest.plot_corner()
+    rmnest.plot_posterior_predictive()
 
     print("Done!")
 
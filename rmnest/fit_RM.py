@@ -1,8 +1,12 @@
+import os
+
 import bilby
+import matplotlib.pyplot as plt
 import numpy as np
 
 from rmnest import utils
 from rmnest.likelihood import FRLikelihood, GFRLikelihood
+from rmnest.model import batch_faraday_rotation, batch_generalised_faraday_rotation
 
 
 class RMNest(object):
@@ -89,6 +93,181 @@ class RMNest(object):
     def plot_corner(self):
         self.result.plot_corner(dpi=100)
 
+    def posterior_predictive(self, nsamples=500, quantiles=(0.16, 0.5, 0.84), seed=None):
+        """Evaluates the fitted model for the posterior samples in a single batched pass.
+
+        Parameters
+        ----------
+        nsamples : int, optional
+            Number of posterior samples to draw (without replacement) for the
+            evaluation, by default 500. None uses every sample, which for large
+            posteriors and many channels can require several GB of memory.
+        quantiles : tuple, optional
+            Quantiles of the model draws to return per channel,
+            by default (0.16, 0.5, 0.84).
+            The median is always returned separately and used for the residuals.
+        seed : int, optional
+            Seed for the random thinning of the posterior, by default None.
+
+        Returns
+        -------
+        dict
+            ``freqs``, the ``quantiles``, and per-quantity dictionaries ``data``,
+            ``model``, ``median`` and ``residuals``. Quantities are the normalised
+            Stokes ``q``, ``u`` (and ``v``), position angle ``psi`` (and ellipticity
+            ``chi``) in deg. Model entries have shape (len(quantiles), nfreq).
+
+        Notes
+        -----
+        Stokes data are normalised by the linear (FR) or total (GFR) polarised
+        intensity to match the unit-amplitude models. Channels with no polarised
+        intensity are returned as NaN. The FR likelihood is invariant to a 90 deg
+        shift in ``psi_zero``, so FR draws are first flipped onto the data-aligned
+        sign of Q and U. Position angle quantiles are
+        taken circularly about the angle of the median model Q and U in each channel,
+        and the data position angles are put on the same branch as the model band.
+        """
+        if nsamples is not None and nsamples < 1:
+            raise ValueError(f"nsamples must be a positive integer, got {nsamples}.")
+
+        posterior = self.result.posterior
+        if nsamples is not None and nsamples < len(posterior):
+            rng = np.random.default_rng(seed)
+            posterior = posterior.iloc[
+                rng.choice(len(posterior), nsamples, replace=False)
+            ]
+
+        s_q = np.asarray(self.s_q, dtype=float)
+        s_u = np.asarray(self.s_u, dtype=float)
+        s_l = np.sqrt(s_q**2 + s_u**2)
+
+        if "grm" in posterior:
+            draws = batch_generalised_faraday_rotation(
+                self.freqs,
+                self.freq_cen,
+                posterior["psi_zero"].values,
+                posterior["grm"].values,
+                alpha=posterior["alpha"].values,
+                chi=posterior["chi"].values,
+                phi=posterior["phi"].values,
+                theta=posterior["theta"].values,
+            )
+            s_v = np.asarray(self.s_v, dtype=float)
+            s_p = np.sqrt(s_l**2 + s_v**2)
+            data = dict(
+                q=_safe_divide(s_q, s_p),
+                u=_safe_divide(s_u, s_p),
+                v=_safe_divide(s_v, s_p),
+                psi=np.where(s_l > 0, 0.5 * np.arctan2(s_u, s_q), np.nan),
+                chi=np.where(s_p > 0, 0.5 * np.arctan2(s_v, s_l), np.nan),
+            )
+        else:
+            draws = batch_faraday_rotation(
+                self.freqs,
+                self.freq_cen,
+                posterior["psi_zero"].values,
+                posterior["rm"].values,
+            )
+            # FRLikelihood cannot tell psi_0 from psi_0 +/- 90 deg, so flip each
+            # draw onto the branch that is aligned with the data
+            sign = np.where(
+                np.sum(s_q * draws["q"] + s_u * draws["u"], axis=1) < 0, -1.0, 1.0
+            )[:, np.newaxis]
+            draws["q"] = sign * draws["q"]
+            draws["u"] = sign * draws["u"]
+            draws["psi"] = 0.5 * np.arctan2(draws["u"], draws["q"])
+            data = dict(
+                q=_safe_divide(s_q, s_l),
+                u=_safe_divide(s_u, s_l),
+                psi=np.where(s_l > 0, 0.5 * np.arctan2(s_u, s_q), np.nan),
+            )
+
+        model = {}
+        median = {}
+        residuals = {}
+        for key, values in draws.items():
+            if key in ("psi", "chi"):
+                values = np.rad2deg(values)
+                data[key] = np.rad2deg(data[key])
+
+            if key == "psi":
+                # Position angles are only defined modulo 180 deg, so take the
+                # quantiles of the offsets from a per-channel circular centre
+                centre = np.rad2deg(
+                    0.5
+                    * np.arctan2(
+                        np.median(draws["u"], axis=0), np.median(draws["q"], axis=0)
+                    )
+                )
+                offsets = (values - centre + 90) % 180 - 90
+                # Keep the median within [-90, 90) and put the band and the data
+                # on the same branch, so the band may extend slightly past +/-90
+                median[key] = (centre + np.median(offsets, axis=0) + 90) % 180 - 90
+                shift = median[key] - np.median(offsets, axis=0) - centre
+                model[key] = centre + shift + np.quantile(offsets, quantiles, axis=0)
+                residuals[key] = (data[key] - median[key] + 90) % 180 - 90
+                data[key] = median[key] + residuals[key]
+            else:
+                model[key] = np.quantile(values, quantiles, axis=0)
+                median[key] = np.median(values, axis=0)
+                residuals[key] = data[key] - median[key]
+
+        return dict(
+            freqs=np.asarray(self.freqs),
+            quantiles=tuple(quantiles),
+            data=data,
+            model=model,
+            median=median,
+            residuals=residuals,
+        )
+
+    def plot_posterior_predictive(
+        self, nsamples=500, quantiles=(0.16, 0.5, 0.84), seed=None, filename=None
+    ):
+        """Plots the data against the posterior-predictive model bands, with residuals.
+
+        The outer ``quantiles`` set the shaded band and the median the model line.
+        By default the figure is saved next to the other bilby outputs as
+        ``<label>_posterior_predictive.png``.
+        """
+        ppd = self.posterior_predictive(nsamples=nsamples, quantiles=quantiles, seed=seed)
+        freqs = ppd["freqs"]
+        keys = list(ppd["model"])
+        labels = dict(
+            q=r"$Q/P$",
+            u=r"$U/P$",
+            v=r"$V/P$",
+            psi=r"$\Psi$ (deg)",
+            chi=r"$\chi$ (deg)",
+        )
+        if "v" not in keys:
+            labels.update(q=r"$Q/L$", u=r"$U/L$")
+
+        fig, axes = plt.subplots(
+            len(keys), 2, sharex=True, figsize=(10, 2 * len(keys)), dpi=100, squeeze=False
+        )
+        for (ax_model, ax_resid), key in zip(axes, keys):
+            model = ppd["model"][key]
+            ax_model.fill_between(freqs, model[0], model[-1], color="C1", alpha=0.4, lw=0)
+            ax_model.plot(freqs, ppd["median"][key], color="C1", lw=1)
+            ax_model.plot(freqs, ppd["data"][key], ".", color="k", ms=2)
+            ax_model.set_ylabel(labels[key])
+
+            ax_resid.axhline(0, color="C1", lw=1)
+            ax_resid.plot(freqs, ppd["residuals"][key], ".", color="k", ms=2)
+
+        axes[0, 1].set_title("Residuals")
+        axes[-1, 0].set_xlabel("Frequency (MHz)")
+        axes[-1, 1].set_xlabel("Frequency (MHz)")
+        fig.tight_layout()
+
+        if filename is None:
+            filename = os.path.join(
+                self.result.outdir, f"{self.result.label}_posterior_predictive.png"
+            )
+        fig.savefig(filename)
+        plt.close(fig)
+
     @classmethod
     def from_psrchive(cls, ar_file, window, dedisperse=False, fscrunch=None):
         import psrchive
@@ -166,3 +345,13 @@ class RMNest(object):
         priors["sigma"] = bilby.core.prior.Uniform(0, 100, r"$\sigma$")
 
         return priors
+
+
+def _safe_divide(numerator, denominator):
+    """Divides by the polarised intensity, returning NaN in unpolarised channels."""
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.full_like(numerator, np.nan),
+        where=denominator > 0,
+    )
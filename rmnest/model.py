@@ -143,3 +143,124 @@ class GeneralisedFaradayRotation(object):
     @property
     def m_chi(self) -> np.ndarray:
         return 0.5 * np.arctan2(self.m_v, np.sqrt(self.m_u**2 + self.m_q**2))
+
+
+def batch_faraday_rotation(
+    freq: np.ndarray,
+    freq_cen: float,
+    psi_0: np.ndarray,
+    rm: np.ndarray,
+) -> dict:
+    """Evaluate the Faraday rotation model for many parameter samples at once.
+
+    Parameters
+    ----------
+    freq : np.ndarray
+        List of observing frequencies. (MHz)
+    freq_cen : float
+        Centre frequency of the observing band. (MHz)
+    psi_0 : np.ndarray
+        Linear polarisation position angle at the centre frequency for each sample. (deg)
+    rm : np.ndarray
+        Rotation measure for each sample. (rad m^-2)
+
+    Returns
+    -------
+    dict
+        Model Stokes ``q`` and ``u`` and the wrapped position angle ``psi`` (rad),
+        each with shape (nsamples, nfreq). Matches :class:`FaradayRotation` row-by-row.
+    """
+    freq = np.asarray(freq, dtype=float)
+    psi_0 = np.atleast_1d(np.asarray(psi_0, dtype=float))[:, np.newaxis]
+    rm = np.atleast_1d(np.asarray(rm, dtype=float))[:, np.newaxis]
+
+    lambda_sq = ((constants.c / (freq * constants.mega)) ** 2) - (
+        (constants.c / (freq_cen * constants.mega)) ** 2
+    )
+    psi = np.deg2rad(psi_0) + rm * lambda_sq[np.newaxis, :]
+
+    m_q = np.cos(2 * psi)
+    m_u = np.sin(2 * psi)
+
+    return dict(q=m_q, u=m_u, psi=0.5 * np.arctan2(m_u, m_q))
+
+
+def batch_generalised_faraday_rotation(
+    freq: np.ndarray,
+    freq_cen: float,
+    psi_0: np.ndarray,
+    grm: np.ndarray,
+    alpha: np.ndarray = 2,
+    chi: np.ndarray = 0,
+    phi: np.ndarray = 0,
+    theta: np.ndarray = 0,
+) -> dict:
+    """Evaluate the generalised Faraday rotation model for many parameter samples at once.
+
+    Parameters
+    ----------
+    freq : np.ndarray
+        List of observing frequencies. (MHz)
+    freq_cen : float
+        Centre frequency of the observing band. (MHz)
+    psi_0 : np.ndarray
+        Linear polarisation position angle at the centre frequency for each sample. (deg)
+    grm : np.ndarray
+        Generalised rotation measure for each sample. (rad m^-alpha)
+    alpha : np.ndarray, optional
+        Frequency scaling index for each sample, by default 2
+    chi : np.ndarray, optional
+        Offset in the ellipticity angle for each sample. (deg), by default 0
+    phi : np.ndarray, optional
+        Rotation about the Stokes V axis for each sample. (deg), by default 0
+    theta : np.ndarray, optional
+        Rotation about the Stokes U axis for each sample. (deg), by default 0
+
+    Returns
+    -------
+    dict
+        Model Stokes ``q``, ``u`` and ``v``, position angle ``psi`` (rad) and
+        ellipticity angle ``chi`` (rad), each with shape (nsamples, nfreq).
+        Matches :class:`GeneralisedFaradayRotation` row-by-row.
+    """
+    freq = np.asarray(freq, dtype=float)
+    psi_0, grm, alpha, chi, phi, theta = np.broadcast_arrays(
+        *[
+            np.atleast_1d(np.asarray(p, dtype=float))
+            for p in (psi_0, grm, alpha, chi, phi, theta)
+        ]
+    )
+
+    wavelength = constants.c / (freq * constants.mega)
+    wavelength_cen = constants.c / (freq_cen * constants.mega)
+    psi = np.deg2rad(psi_0)[:, np.newaxis] + grm[:, np.newaxis] * (
+        (wavelength[np.newaxis, :] ** alpha[:, np.newaxis])
+        - (wavelength_cen ** alpha[:, np.newaxis])
+    )
+
+    # Model Stokes components, shape (nsamples, 3, nfreq)
+    cos_chi = np.cos(2 * np.deg2rad(chi))[:, np.newaxis]
+    stokes_params = np.stack(
+        [
+            np.cos(2 * psi) * cos_chi,
+            np.sin(2 * psi) * cos_chi,
+            np.broadcast_to(np.sin(2 * np.deg2rad(chi))[:, np.newaxis], psi.shape),
+        ],
+        axis=1,
+    )
+
+    # Inverse rotation about the V and U axis, i.e. apply the transpose of each matrix
+    rot_matrices = Rotation.from_euler(
+        "zy", np.column_stack([phi, theta]), degrees=True
+    ).as_matrix()
+    rotated_stokes = np.einsum("nji,njf->nif", rot_matrices, stokes_params)
+
+    m_q, m_u, m_v = rotated_stokes[:, 0], rotated_stokes[:, 1], rotated_stokes[:, 2]
+
+    return dict(
+        q=m_q,
+        u=m_u,
+        v=m_v,
+        psi=0.5 * np.arctan2(m_u, m_q),
+        chi=0.5 * np.arctan2(m_v, np.sqrt(m_u**2 + m_q**2)),
+    )
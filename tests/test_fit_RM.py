@@ -0,0 +1,178 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rmnest.fit_RM import RMNest
+from rmnest.model import FaradayRotation, GeneralisedFaradayRotation
+
+FREQS = np.linspace(1100, 1500, 32)
+FREQ_CEN = 1300.0
+NPOST = 200
+
+
+def _fr_rmnest(rng):
+    fr_model = FaradayRotation(FREQS, FREQ_CEN, 20.0, 1450.0)
+    rmnest = RMNest(FREQS, FREQ_CEN, 3 * fr_model.m_q, 3 * fr_model.m_u, None)
+    posterior = pd.DataFrame(
+        dict(
+            psi_zero=20 + rng.normal(size=NPOST),
+            rm=1450 + 0.1 * rng.normal(size=NPOST),
+            sigma=np.ones(NPOST),
+        )
+    )
+    rmnest.result = SimpleNamespace(posterior=posterior)
+    return rmnest
+
+
+def _gfr_rmnest(rng):
+    gfr_model = GeneralisedFaradayRotation(FREQS, FREQ_CEN, 20.0, 50.0, 3, 10, 30, 40)
+    rmnest = RMNest(FREQS, FREQ_CEN, gfr_model.m_q, gfr_model.m_u, gfr_model.m_v)
+    posterior = pd.DataFrame(
+        dict(
+            psi_zero=20 + rng.normal(size=NPOST),
+            grm=50 + 0.1 * rng.normal(size=NPOST),
+            alpha=np.full(NPOST, 3.0),
+            chi=10 + rng.normal(size=NPOST),
+            phi=np.full(NPOST, 30.0),
+            theta=np.full(NPOST, 40.0),
+            sigma=np.ones(NPOST),
+        )
+    )
+    rmnest.result = SimpleNamespace(posterior=posterior)
+    return rmnest
+
+
+@pytest.mark.parametrize(
+    "make_rmnest, keys",
+    [
+        (_fr_rmnest, ["q", "u", "psi"]),
+        (_gfr_rmnest, ["q", "u", "v", "psi", "chi"]),
+    ],
+)
+@pytest.mark.parametrize("nsamples", [None, 50])
+def test_posterior_predictive_shapes(make_rmnest, keys, nsamples):
+    rmnest = make_rmnest(np.random.default_rng(1))
+    quantiles = (0.05, 0.16, 0.5, 0.84, 0.95)
+
+    ppd = rmnest.posterior_predictive(nsamples=nsamples, quantiles=quantiles, seed=2)
+
+    assert ppd["quantiles"] == quantiles
+    assert sorted(ppd["model"]) == sorted(keys)
+    for key in keys:
+        assert ppd["model"][key].shape == (len(quantiles), len(FREQS))
+        assert ppd["data"][key].shape == (len(FREQS),)
+        assert ppd["residuals"][key].shape == (len(FREQS),)
+        assert np.all(np.diff(ppd["model"][key], axis=0) >= 0)
+
+    # The data are drawn from the posterior median model
+    np.testing.assert_allclose(ppd["residuals"]["q"], 0, atol=0.05)
+    np.testing.assert_allclose(ppd["residuals"]["psi"], 0, atol=2)
+
+
+def test_posterior_predictive_folds_bimodal_fr_posterior():
+    rng = np.random.default_rng(1)
+    fr_model = FaradayRotation(FREQS, FREQ_CEN, 20.0, 1450.0)
+    rmnest = RMNest(FREQS, FREQ_CEN, fr_model.m_q, fr_model.m_u, None)
+    # psi_zero and psi_zero - 90 deg have the same FR likelihood
+    psi_zero = np.concatenate([np.full(NPOST // 2, 20.0), np.full(NPOST // 2, -70.0)])
+    posterior = pd.DataFrame(
+        dict(
+            psi_zero=psi_zero + 0.1 * rng.normal(size=NPOST),
+            rm=1450 + 0.01 * rng.normal(size=NPOST),
+            sigma=np.ones(NPOST),
+        )
+    )
+    rmnest.result = SimpleNamespace(posterior=posterior)
+
+    ppd = rmnest.posterior_predictive(nsamples=None)
+
+    np.testing.assert_allclose(ppd["model"]["q"][1], fr_model.m_q, atol=0.02)
+    np.testing.assert_allclose(ppd["model"]["u"][1], fr_model.m_u, atol=0.02)
+    assert np.all(ppd["model"]["q"][-1] - ppd["model"]["q"][0] < 0.05)
+    np.testing.assert_allclose(ppd["residuals"]["psi"], 0, atol=0.5)
+
+
+@pytest.mark.parametrize("make_rmnest", [_fr_rmnest, _gfr_rmnest])
+def test_posterior_predictive_median_is_independent_of_quantiles(make_rmnest):
+    rmnest = make_rmnest(np.random.default_rng(1))
+
+    ppd = rmnest.posterior_predictive(nsamples=None, quantiles=(0.05, 0.5, 0.84, 0.95))
+    central = rmnest.posterior_predictive(nsamples=None, quantiles=(0.5,))
+
+    for key in ppd["model"]:
+        np.testing.assert_allclose(ppd["median"][key], central["model"][key][0])
+        np.testing.assert_allclose(ppd["model"][key][1], ppd["median"][key])
+        np.testing.assert_allclose(
+            ppd["residuals"][key], ppd["data"][key] - ppd["median"][key], atol=1e-12
+        )
+
+
+def test_posterior_predictive_thinning_is_seeded():
+    rmnest = _gfr_rmnest(np.random.default_rng(1))
+
+    first = rmnest.posterior_predictive(nsamples=10, seed=3)
+    second = rmnest.posterior_predictive(nsamples=10, seed=3)
+    everything = rmnest.posterior_predictive(nsamples=None)
+
+    np.testing.assert_array_equal(first["model"]["q"], second["model"]["q"])
+    assert not np.array_equal(first["model"]["q"], everything["model"]["q"])
+
+
+def test_posterior_predictive_psi_band_is_circular():
+    rng = np.random.default_rng(1)
+    fr_model = FaradayRotation(FREQS, FREQ_CEN, 89.5, 0.0)
+    s_u = fr_model.m_u + 0.02 * rng.normal(size=len(FREQS))
+    rmnest = RMNest(FREQS, FREQ_CEN, fr_model.m_q, s_u, None)
+    # Position angles of the draws and the data straddle the +/-90 deg wrap
+    posterior = pd.DataFrame(
+        dict(
+            psi_zero=89 + 2 * rng.normal(size=NPOST),
+            rm=rng.normal(size=NPOST),
+            sigma=np.ones(NPOST),
+        )
+    )
+    rmnest.result = SimpleNamespace(posterior=posterior)
+
+    ppd = rmnest.posterior_predictive(nsamples=None)
+
+    band_width = ppd["model"]["psi"][-1] - ppd["model"]["psi"][0]
+    assert np.all(band_width < 30)
+    assert np.all(np.abs(ppd["residuals"]["psi"]) <= 90)
+
+    # The data are plotted on the same branch as the band
+    assert np.all(ppd["data"]["psi"] >= ppd["model"]["psi"][0] - 1)
+    assert np.all(ppd["data"]["psi"] <= ppd["model"]["psi"][-1] + 1)
+
+
+@pytest.mark.parametrize("nsamples", [0, -5])
+def test_posterior_predictive_rejects_non_positive_nsamples(nsamples):
+    rmnest = _fr_rmnest(np.random.default_rng(1))
+
+    with pytest.raises(ValueError):
+        rmnest.posterior_predictive(nsamples=nsamples)
+
+
+def test_posterior_predictive_masks_unpolarised_channels():
+    rmnest = _gfr_rmnest(np.random.default_rng(1))
+    for stokes in (rmnest.s_q, rmnest.s_u, rmnest.s_v):
+        stokes[0] = 0.0
+
+    with np.errstate(all="raise"):
+        ppd = rmnest.posterior_predictive()
+
+    for key in ppd["data"]:
+        assert np.isnan(ppd["data"][key][0])
+        assert np.all(np.isfinite(ppd["data"][key][1:]))
+
+
+@pytest.mark.parametrize("make_rmnest", [_fr_rmnest, _gfr_rmnest])
+def test_plot_posterior_predictive_writes_figure(make_rmnest, tmp_path):
+    rmnest = make_rmnest(np.random.default_rng(1))
+    rmnest.result.outdir = str(tmp_path)
+    rmnest.result.label = "testrun"
+
+    rmnest.plot_posterior_predictive(nsamples=50, seed=1)
+
+    assert (tmp_path / "testrun_posterior_predictive.png").is_file()
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from rmnest.model import (
+    FaradayRotation,
+    GeneralisedFaradayRotation,
+    batch_faraday_rotation,
+    batch_generalised_faraday_rotation,
+)
+
+FREQS = np.linspace(700, 4000, 64)
+FREQ_CEN = 1400.0
+NSAMPLES = 20
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+def test_batch_faraday_rotation_matches_scalar_model(rng):
+    psi_0 = rng.uniform(-90, 90, NSAMPLES)
+    rm = rng.uniform(-2000, 2000, NSAMPLES)
+
+    draws = batch_faraday_rotation(FREQS, FREQ_CEN, psi_0, rm)
+
+    for key in ("q", "u", "psi"):
+        assert draws[key].shape == (NSAMPLES, len(FREQS))
+
+    for isamp in range(NSAMPLES):
+        fr_model = FaradayRotation(FREQS, FREQ_CEN, psi_0[isamp], rm[isamp])
+        np.testing.assert_allclose(draws["q"][isamp], fr_model.m_q, atol=1e-12)
+        np.testing.assert_allclose(draws["u"][isamp], fr_model.m_u, atol=1e-12)
+        # The scalar model does not wrap the position angle
+        np.testing.assert_allclose(
+            np.exp(2j * draws["psi"][isamp]), np.exp(2j * fr_model.m_psi), atol=1e-12
+        )
+        assert np.all(np.abs(draws["psi"][isamp]) <= np.pi / 2)
+
+
+def test_batch_generalised_faraday_rotation_matches_scalar_model(rng):
+    params = dict(
+        psi_0=rng.uniform(-90, 90, NSAMPLES),
+        grm=rng.uniform(0, 200, NSAMPLES),
+        alpha=rng.uniform(0, 10, NSAMPLES),
+        chi=rng.uniform(-45, 45, NSAMPLES),
+        phi=rng.uniform(-180, 180, NSAMPLES),
+        theta=rng.uniform(0, 180, NSAMPLES),
+    )
+
+    draws = batch_generalised_faraday_rotation(FREQS, FREQ_CEN, **params)
+
+    for isamp in range(NSAMPLES):
+        gfr_model = GeneralisedFaradayRotation(
+            FREQS, FREQ_CEN, **{key: value[isamp] for key, value in params.items()}
+        )
+        np.testing.assert_allclose(draws["q"][isamp], gfr_model.m_q, atol=1e-12)
+        np.testing.assert_allclose(draws["u"][isamp], gfr_model.m_u, atol=1e-12)
+        np.testing.assert_allclose(draws["v"][isamp], gfr_model.m_v, atol=1e-12)
+        np.testing.assert_allclose(draws["psi"][isamp], gfr_model.m_psi, atol=1e-12)
+        np.testing.assert_allclose(draws["chi"][isamp], gfr_model.m_chi, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "fixed",
+    [
+        dict(),
+        dict(alpha=3),
+        dict(alpha=3, chi=10.0, phi=-30.0, theta=60.0),
+    ],
+)
+def test_batch_generalised_faraday_rotation_broadcasts_scalars(rng, fixed):
+    psi_0 = rng.uniform(-90, 90, NSAMPLES)
+    grm = rng.uniform(0, 200, NSAMPLES)
+
+    draws = batch_generalised_faraday_rotation(FREQS, FREQ_CEN, psi_0, grm, **fixed)
+
+    for key in ("q", "u", "v", "psi", "chi"):
+        assert draws[key].shape == (NSAMPLES, len(FREQS))
+
+    for isamp in range(NSAMPLES):
+        gfr_model = GeneralisedFaradayRotation(
+            FREQS, FREQ_CEN, psi_0[isamp], grm[isamp], **fixed
+        )
+        np.testing.assert_allclose(draws["q"][isamp], gfr_model.m_q, atol=1e-12)
+        np.testing.assert_allclose(draws["u"][isamp], gfr_model.m_u, atol=1e-12)
+        np.testing.assert_allclose(draws["v"][isamp], gfr_model.m_v, atol=1e-12)
+
+
+def test_batch_generalised_faraday_rotation_single_sample():
+    draws = batch_generalised_faraday_rotation(FREQS, FREQ_CEN, 10.0, 50.0, alpha=3)
+    gfr_model = GeneralisedFaradayRotation(FREQS, FREQ_CEN, 10.0, 50.0, alpha=3)
+
+    assert draws["q"].shape == (1, len(FREQS))
+    np.testing.assert_allclose(draws["q"][0], gfr_model.m_q, atol=1e-12)